@@ -0,0 +1,92 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import HistGradientBoostingClassifier
+
+
+class BinnedGradientBoostingModel:
+    """
+    Histogram-based gradient boosting trained on a uint8 binned feature matrix.
+
+    The classifier quantizes the float features once into at most `max_bins` quantile bins plus
+    a bin reserved for missing values, so NaNs learn their own split direction. Class imbalance
+    is handled with class weighting instead of oversampling, and the bin edges learned at
+    training time are kept with the model and reused when scoring.
+    """
+
+    def __init__(self, max_bins: int = 255, class_weight: str = 'balanced', **model_params):
+        model_params.setdefault('random_state', 42)
+        # The internal validation split copies the whole float matrix, so it is opt-in
+        model_params.setdefault('early_stopping', False)
+        self.model = HistGradientBoostingClassifier(max_bins=max_bins, class_weight=class_weight, **model_params)
+        self.feature_cols = None
+
+    def fit(self, X: pd.DataFrame, y, feature_cols: list = None):
+        """
+        Fits the classifier directly on the float features, without densifying or copying them.
+
+        Parameters:
+        -----------
+        X : pd.DataFrame
+            Training features; NaNs are kept as missing values.
+        y : array-like
+            Binary target.
+        feature_cols : list, optional
+            Columns to train on. Defaults to every numeric column of `X`.
+
+        Returns:
+        --------
+        BinnedGradientBoostingModel
+            The fitted model.
+        """
+        if feature_cols is None:
+            feature_cols = X.select_dtypes(include=[np.number]).columns.tolist()
+        missing_cols = [col for col in feature_cols if col not in X.columns]
+        if missing_cols:
+            raise ValueError(f"Columns {missing_cols} not found in DataFrame.")
+
+        self.model.fit(X[feature_cols], np.asarray(y))
+        self.feature_cols = list(feature_cols)
+        return self
+
+    def _features(self, X: pd.DataFrame) -> pd.DataFrame:
+        if self.feature_cols is None:
+            raise ValueError("BinnedGradientBoostingModel is not fitted. Call 'fit' first.")
+        return X[self.feature_cols]
+
+    @property
+    def bin_edges(self) -> dict:
+        """Upper edges of the non-missing bins of each feature, as learned at training time."""
+        if self.feature_cols is None:
+            return {}
+        return dict(zip(self.feature_cols, self.model._bin_mapper.bin_thresholds_))
+
+    @property
+    def missing_bin(self) -> int:
+        """Bin code of missing values in `transform` output."""
+        return int(self.model._bin_mapper.missing_values_bin_idx_)
+
+    def transform(self, X: pd.DataFrame) -> np.ndarray:
+        """
+        Maps features onto the stored bins, returning the (n_rows, n_features) uint8 matrix the
+        trees split on.
+        """
+        features = self._features(X).to_numpy(dtype=np.float64, na_value=np.nan)
+        return self.model._bin_mapper.transform(features)
+
+    def predict_proba(self, X: pd.DataFrame) -> np.ndarray:
+        return self.model.predict_proba(self._features(X))
+
+    def predict(self, X: pd.DataFrame) -> np.ndarray:
+        return self.model.predict(self._features(X))
+
+    def save(self, path: str):
+        """Pickles the fitted model together with its bin edges."""
+        with open(path, 'wb') as f:
+            pickle.dump(self, f)
+
+    @staticmethod
+    def load(path: str) -> 'BinnedGradientBoostingModel':
+        with open(path, 'rb') as f:
+            return pickle.load(f)
@@ -0,0 +1,99 @@
+import argparse
+import os
+import sys
+
+import pandas as pd
+
+from credit_scoring_model import CreditScoreRFM
+
+# The index format is shared with the API, which reads it at serving time
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'api')))
+from risk_index import write_risk_index  # noqa: E402
+
+
+def build_customer_features(transactions: pd.DataFrame) -> pd.DataFrame:
+    """
+    Builds one row per customer with the latest RFM metrics and aggregate transaction features.
+
+    Parameters:
+    -----------
+    transactions : pd.DataFrame
+        Transaction-level data with 'CustomerId', 'TransactionId', 'TransactionStartTime' and 'Amount'.
+
+    Returns:
+    --------
+    pd.DataFrame
+        Customer-level features keyed by 'CustomerId'.
+    """
+    rfm = CreditScoreRFM(transactions[['CustomerId', 'TransactionStartTime', 'Amount']].copy()).calculate_rfm()
+
+    # Same aggregates as FeatureEngineering.create_aggregate_features, without merging them back
+    # onto every transaction
+    aggregates = transactions.groupby('CustomerId').agg(
+        Total_Transaction_Amount=('Amount', 'sum'),
+        Average_Transaction_Amount=('Amount', 'mean'),
+        Transaction_Count=('TransactionId', 'count'),
+        Std_Transaction_Amount=('Amount', 'std'),
+    ).reset_index()
+
+    # A single transaction has no spread, and a customer without any valid amount averages nothing
+    aggregates['Std_Transaction_Amount'] = aggregates['Std_Transaction_Amount'].fillna(0.0)
+    aggregates['Average_Transaction_Amount'] = aggregates['Average_Transaction_Amount'].fillna(0.0)
+
+    return rfm.merge(aggregates, on='CustomerId', how='left')
+
+
+def score_customers(transactions: pd.DataFrame, model, feature_cols: list = None) -> pd.DataFrame:
+    """
+    Scores every customer with a fitted classifier exposing `predict_proba`.
+
+    The model must be trained on `build_customer_features` output. Its feature columns are read
+    from `feature_names_in_` unless `feature_cols` is given.
+
+    Returns a DataFrame with 'CustomerId' and 'risk_probability' columns.
+    """
+    if feature_cols is None:
+        feature_cols = getattr(model, 'feature_names_in_', None)
+        if feature_cols is None:
+            raise ValueError("Model has no 'feature_names_in_'. Pass the customer feature columns it was trained on.")
+    features = build_customer_features(transactions)
+    missing_cols = [col for col in feature_cols if col not in features.columns]
+    if missing_cols:
+        raise ValueError(f"Model expects columns {missing_cols}, which are not customer features.")
+    probabilities = model.predict_proba(features[list(feature_cols)])[:, 1]
+    return pd.DataFrame({'CustomerId': features['CustomerId'], 'risk_probability': probabilities})
+
+
+def build_risk_index(transactions: pd.DataFrame, model, output_path: str, model_version: str,
+                     feature_cols: list = None) -> pd.DataFrame:
+    """
+    Scores every customer and writes the memory-mapped index served by GET /customers/{id}/risk.
+    """
+    scores = score_customers(transactions, model, feature_cols)
+    write_risk_index(output_path, scores['CustomerId'], scores['risk_probability'], model_version)
+    return scores
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build the precomputed customer risk index.")
+    parser.add_argument('data_path', help="Transaction CSV file.")
+    parser.add_argument('--output', default='risk_index', help="Location of the index.")
+    parser.add_argument('--model-uri', required=True,
+                        help="MLflow URI of a scikit-learn model trained on the customer features, fitted on a "
+                             "DataFrame so its feature columns are recorded.")
+    return parser.parse_args(argv)
+
+
+# ====== Example Usage ======
+if __name__ == '__main__':
+    args = parse_args()
+
+    import mlflow
+
+    print("🟢 Building customer risk index...")
+    transactions = pd.read_csv(args.data_path)
+    model = mlflow.sklearn.load_model(args.model_uri)
+    model_version = mlflow.models.get_model_info(args.model_uri).run_id
+
+    scores = build_risk_index(transactions, model, args.output, model_version)
+    print(f"✅ Indexed {len(scores)} customers to '{args.output}' (model {model_version}).")
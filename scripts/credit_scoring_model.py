@@ -1,8 +1,10 @@
 # Import libraries
+import json
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
+from stage_profiler import profile_stage
 
 class CreditScoreRFM:
     """
@@ -27,6 +29,7 @@ class CreditScoreRFM:
     #     rfm_data = self.rfm_data[['CustomerId', 'Recency', 'Frequency', 'Monetary']].drop_duplicates()
     #     return rfm_data
 
+    @profile_stage
     def calculate_rfm(self):
         # Convert TransactionStartTime to datetime format
         if not pd.api.types.is_datetime64_any_dtype(self.rfm_data['TransactionStartTime']):
@@ -56,6 +59,7 @@ class CreditScoreRFM:
 
 
 
+    @profile_stage
     def calculate_rfm_scores(self, rfm_data):
         rfm_data['r_quartile'] = pd.qcut(rfm_data['Recency'], 4, labels=['4', '3', '2', '1'])
         rfm_data['f_quartile'] = pd.qcut(rfm_data['Frequency'], 4, labels=['1', '2', '3', '4'])
@@ -71,6 +75,7 @@ class CreditScoreRFM:
         return rfm_data
 
 
+    @profile_stage
     def assign_label(self, rfm_data):
         low_threshold = rfm_data['RFM_Score'].quantile(0.5)
         rfm_data['Risk_Label'] = rfm_data['RFM_Score'].apply(lambda x: 'Good' if x >= low_threshold else 'Bad')
@@ -105,6 +110,7 @@ class CreditScoreRFM:
         plt.tight_layout()
         plt.show()
 
+    @profile_stage
     def calculate_counts(self, data):
         """
         Calculate good and bad counts for each RFM_bin.
@@ -115,6 +121,7 @@ class CreditScoreRFM:
         
         return good_count, bad_count
     
+    @profile_stage
     def calculate_woe(self, good_count, bad_count):
         total_good = good_count.sum()
         total_bad = bad_count.sum()
@@ -129,4 +136,111 @@ class CreditScoreRFM:
         woe = np.log((good_rate + epsilon) / (bad_rate + epsilon))  # Add epsilon to rates
         
         # Return WoE as a Series with the same index as good_count
-        return pd.Series(woe, index=good_count.index)
\ No newline at end of file
+        return pd.Series(woe, index=good_count.index)
+
+class RFMScorer:
+    """
+    A fitted RFM scorer that stores the R/F/M quartile edges, score weights and label threshold,
+    so new customers can be scored without recomputing the whole population.
+    """
+
+    RFM_COLUMNS = ('Recency', 'Frequency', 'Monetary')
+
+    def __init__(self, weights=(0.1, 0.45, 0.45), n_quantiles: int = 4):
+        self.weights = tuple(float(w) for w in weights)
+        self.n_quantiles = n_quantiles
+        self.edges = {}
+        self.threshold = None
+
+    def fit(self, rfm_data: pd.DataFrame):
+        """
+        Learns the quantile edges of Recency, Frequency and Monetary and the median RFM score.
+
+        Parameters:
+        -----------
+        rfm_data : pd.DataFrame
+            One row per customer with 'Recency', 'Frequency' and 'Monetary' columns.
+
+        Returns:
+        --------
+        RFMScorer
+            The fitted scorer.
+        """
+        probs = np.linspace(0, 1, self.n_quantiles + 1)
+        # Tied quantiles are dropped like pd.qcut(duplicates='drop'), so skewed columns get fewer,
+        # densely numbered quartiles instead of skipping some
+        self.edges = {
+            col: np.unique(np.quantile(values, probs))[1:-1]
+            for col, values in self._rfm_values(rfm_data).items()
+        }
+        self.threshold = float(np.quantile(self.score(rfm_data), 0.5))
+        return self
+
+    def _rfm_values(self, rfm_data: pd.DataFrame) -> dict:
+        # Missing values would otherwise be sorted past every edge into the outer quartile
+        values = {}
+        for col in self.RFM_COLUMNS:
+            values[col] = rfm_data[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            n_missing = int(np.isnan(values[col]).sum())
+            if n_missing:
+                raise ValueError(f"Column '{col}' has {n_missing} missing values. Cannot score RFM.")
+        return values
+
+    def _quartiles(self, rfm_data: pd.DataFrame) -> dict:
+        # Intervals are right-closed like pd.qcut, so side='left' gives the matching bin
+        return {
+            col: np.searchsorted(self.edges[col], values, side='left') + 1
+            for col, values in self._rfm_values(rfm_data).items()
+        }
+
+    def _score_quartiles(self, quartiles: dict) -> np.ndarray:
+        # Recent customers get the highest recency score
+        r_score = len(self.edges['Recency']) + 2 - quartiles['Recency']
+        w_r, w_f, w_m = self.weights
+        return r_score * w_r + quartiles['Frequency'] * w_f + quartiles['Monetary'] * w_m
+
+    def score(self, rfm_data: pd.DataFrame) -> np.ndarray:
+        """Returns the weighted RFM score of each row."""
+        if not self.edges:
+            raise ValueError("RFMScorer is not fitted. Call 'fit' or 'load' first.")
+        return self._score_quartiles(self._quartiles(rfm_data))
+
+    def transform(self, rfm_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Adds quartile, 'RFM_Score' and 'Risk_Label' columns using the fitted edges and threshold.
+        """
+        if self.threshold is None:
+            raise ValueError("RFMScorer is not fitted. Call 'fit' or 'load' first.")
+        rfm_data = rfm_data.copy()
+        quartiles = self._quartiles(rfm_data)
+        rfm_data['r_quartile'] = len(self.edges['Recency']) + 2 - quartiles['Recency']
+        rfm_data['f_quartile'] = quartiles['Frequency']
+        rfm_data['m_quartile'] = quartiles['Monetary']
+        rfm_data['RFM_Score'] = self._score_quartiles(quartiles)
+        rfm_data['Risk_Label'] = np.where(rfm_data['RFM_Score'] >= self.threshold, 'Good', 'Bad')
+        return rfm_data
+
+    def to_dict(self) -> dict:
+        return {
+            'weights': list(self.weights),
+            'n_quantiles': self.n_quantiles,
+            'edges': {col: edges.tolist() for col, edges in self.edges.items()},
+            'threshold': self.threshold,
+        }
+
+    @classmethod
+    def from_dict(cls, params: dict) -> 'RFMScorer':
+        scorer = cls(weights=params['weights'], n_quantiles=params['n_quantiles'])
+        scorer.edges = {col: np.asarray(edges, dtype=np.float64) for col, edges in params['edges'].items()}
+        scorer.threshold = params['threshold']
+        return scorer
+
+    def save(self, path: str):
+        """Writes the fitted edges, weights and threshold to a small JSON artifact."""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str) -> 'RFMScorer':
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
@@ -2,6 +2,7 @@ import pandas as pd
 import numpy as np
 from sklearn.preprocessing import LabelEncoder, StandardScaler, MinMaxScaler
 from sklearn.impute import SimpleImputer
+from stage_profiler import profile_stage, profiler
 
 class FeatureEngineering:
     """
@@ -9,6 +10,7 @@ class FeatureEngineering:
     """
 
     @staticmethod
+    @profile_stage
     def create_aggregate_features(df: pd.DataFrame) -> pd.DataFrame:
         """
         Creates aggregate features such as total, average, count, and standard deviation of transaction amounts.
@@ -29,6 +31,7 @@ class FeatureEngineering:
         return df
 
     @staticmethod
+    @profile_stage
     def extract_time_features(df: pd.DataFrame) -> pd.DataFrame:
         """
         Extracts time-related features from the TransactionStartTime column.
@@ -46,6 +49,7 @@ class FeatureEngineering:
         return df
 
     @staticmethod
+    @profile_stage
     def encode_categorical_features(df: pd.DataFrame, categorical_cols: list) -> pd.DataFrame:
         """
         Encodes categorical variables into numerical format using Label Encoding.
@@ -61,6 +65,7 @@ class FeatureEngineering:
         return df
 
     @staticmethod
+    @profile_stage
     def handle_missing_values(df: pd.DataFrame, strategy: str = 'mean') -> pd.DataFrame:
         """
         Handles missing values using a specified imputation strategy or drops them.
@@ -77,6 +82,7 @@ class FeatureEngineering:
         return df
 
     @staticmethod
+    @profile_stage
     def normalize_numerical_features(df: pd.DataFrame, numerical_cols: list, method: str = 'standardize') -> pd.DataFrame:
         """
         Normalizes or standardizes numerical features.
@@ -92,6 +98,207 @@ class FeatureEngineering:
         df[numerical_cols] = scaler.fit_transform(df[numerical_cols])
         return df
 
+    @staticmethod
+    def plan() -> 'FeaturePlan':
+        """
+        Starts a lazy FeaturePlan, which records chained steps and runs them in one fused pass.
+        """
+        return FeaturePlan()
+
+
+AGGREGATE_COLS = ['Total_Transaction_Amount', 'Average_Transaction_Amount', 'Transaction_Count', 'Std_Transaction_Amount']
+TIME_COLS = ['Transaction_Hour', 'Transaction_Day', 'Transaction_Month', 'Transaction_Year']
+
+
+class FeaturePlan:
+    """
+    A lazy execution plan for chained FeatureEngineering steps.
+
+    Steps are recorded with the same names and arguments as the eager FeatureEngineering methods
+    and run by `execute`, which produces the same result as the eager chain. Only the columns the
+    requested output depends on are read, aggregates are broadcast by group codes instead of merged,
+    and the result is materialized once instead of copying the frame at every step.
+    """
+
+    def __init__(self):
+        self.steps = []
+        self.output_cols = None
+
+    def create_aggregate_features(self) -> 'FeaturePlan':
+        self.steps.append(('aggregate', None))
+        return self
+
+    def extract_time_features(self) -> 'FeaturePlan':
+        self.steps.append(('time', None))
+        return self
+
+    def encode_categorical_features(self, categorical_cols: list) -> 'FeaturePlan':
+        self.steps.append(('encode', list(categorical_cols)))
+        return self
+
+    def handle_missing_values(self, strategy: str = 'mean') -> 'FeaturePlan':
+        if strategy not in ['mean', 'median', 'most_frequent', 'remove']:
+            raise ValueError("Invalid strategy. Choose from 'mean', 'median', 'most_frequent', or 'remove'.")
+        self.steps.append(('impute', strategy))
+        return self
+
+    def normalize_numerical_features(self, numerical_cols: list, method: str = 'standardize') -> 'FeaturePlan':
+        if method not in ['standardize', 'normalize']:
+            raise ValueError("Method must be either 'standardize' or 'normalize'")
+        self.steps.append(('normalize', (list(numerical_cols), method)))
+        return self
+
+    def select(self, columns: list) -> 'FeaturePlan':
+        """Restricts the output to `columns`, letting the plan skip everything they do not need."""
+        self.output_cols = list(columns)
+        return self
+
+    def _resolve_schemas(self, columns: list) -> list:
+        """Validates the steps against the input columns and returns the column order after each step."""
+        schema = list(columns)
+        schemas = []
+        for kind, arg in self.steps:
+            if kind == 'aggregate':
+                for col in ['CustomerId', 'TransactionId', 'Amount']:
+                    if col not in schema:
+                        raise ValueError(f"Missing required column: {col}")
+                schema = schema + [col for col in AGGREGATE_COLS if col not in schema]
+            elif kind == 'time':
+                if 'TransactionStartTime' not in schema:
+                    raise ValueError("Missing required column: TransactionStartTime")
+                schema = schema + [col for col in TIME_COLS if col not in schema]
+            elif kind == 'encode':
+                for col in arg:
+                    if col not in schema:
+                        raise ValueError(f"Column '{col}' not found in DataFrame.")
+            elif kind == 'normalize':
+                missing = [col for col in arg[0] if col not in schema]
+                if missing:
+                    raise KeyError(f"{missing} not in index")
+            schemas.append(schema)
+        return schemas
+
+    def _required_columns(self, input_cols: list, schemas: list, output_cols: list) -> list:
+        """
+        Walks the steps backwards and returns, for each step, the columns needed after it,
+        preceded by the input columns needed before the first step.
+        """
+        needed = set(output_cols)
+        required = [needed]
+        for i in range(len(self.steps) - 1, -1, -1):
+            kind, arg = self.steps[i]
+            needed = set(needed)
+            if kind == 'aggregate' and needed.intersection(AGGREGATE_COLS):
+                needed.difference_update(AGGREGATE_COLS)
+                needed.update(['CustomerId', 'TransactionId', 'Amount'])
+            elif kind == 'time' and needed.intersection(TIME_COLS + ['TransactionStartTime']):
+                needed.difference_update(TIME_COLS)
+                needed.add('TransactionStartTime')
+            elif kind == 'impute' and arg == 'remove':
+                # Rows are dropped on missing values in any column, so every column counts
+                needed = set(schemas[i - 1] if i > 0 else input_cols)
+            required.append(needed)
+        return required[::-1]
+
+    @staticmethod
+    def _broadcast_aggregates(customer_ids: pd.Series, transaction_ids: pd.Series, amount: pd.Series) -> dict:
+        """Computes per-customer aggregates with bincount over group codes and broadcasts them to rows."""
+        codes, uniques = pd.factorize(customer_ids)
+        n_groups = len(uniques)
+        has_key = codes >= 0
+        group = codes[has_key]
+
+        values = amount.to_numpy(dtype=np.float64, na_value=np.nan)[has_key]
+        present = ~np.isnan(values)
+        amount_count = np.bincount(group[present], minlength=n_groups)
+        total = np.bincount(group, weights=np.where(present, values, 0.0), minlength=n_groups)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = total / amount_count
+            deviations = values[present] - mean[group[present]]
+            squares = np.bincount(group[present], weights=deviations ** 2, minlength=n_groups)
+            std = np.sqrt(squares / (amount_count - 1))
+        std[amount_count < 2] = np.nan
+        transaction_count = np.bincount(group[transaction_ids.notna().to_numpy()[has_key]], minlength=n_groups)
+        if pd.api.types.is_integer_dtype(amount.dtype):
+            total = total.astype(amount.dtype)
+
+        aggregates = {}
+        for name, per_group in zip(AGGREGATE_COLS, [total, mean, transaction_count, std]):
+            if has_key.all():
+                aggregates[name] = per_group[codes]
+            else:
+                # Rows without a customer get no aggregate, as with the eager left merge
+                broadcast = np.full(len(codes), np.nan)
+                broadcast[has_key] = per_group[group]
+                aggregates[name] = broadcast
+        return aggregates
+
+    @profile_stage(name='FeaturePlan.execute')
+    def execute(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Runs the recorded steps on `df` and returns the result of the equivalent eager chain,
+        restricted to the selected columns. `df` is not modified.
+        """
+        schemas = self._resolve_schemas(df.columns)
+        final_schema = schemas[-1] if schemas else list(df.columns)
+        output_cols = final_schema if self.output_cols is None else self.output_cols
+        missing = [col for col in output_cols if col not in final_schema]
+        if missing:
+            raise KeyError(f"{missing} not in index")
+        required = self._required_columns(list(df.columns), schemas, output_cols)
+
+        # Working columns share the input's buffers; steps replace entries instead of copying the frame
+        index = df.index
+        columns = {col: df[col].array for col in df.columns if col in required[0]}
+
+        def series(col):
+            return pd.Series(columns[col], index=index, copy=False)
+
+        for (kind, arg), needed in zip(self.steps, required[1:]):
+            if kind == 'aggregate':
+                if needed.intersection(AGGREGATE_COLS):
+                    aggregates = self._broadcast_aggregates(series('CustomerId'), series('TransactionId'), series('Amount'))
+                    columns.update({col: values for col, values in aggregates.items() if col in needed})
+                index = pd.RangeIndex(len(index))
+            elif kind == 'time':
+                if needed.intersection(TIME_COLS + ['TransactionStartTime']):
+                    timestamps = pd.to_datetime(series('TransactionStartTime'), errors='coerce')
+                    columns['TransactionStartTime'] = timestamps.array
+                    for col, values in zip(TIME_COLS, [timestamps.dt.hour, timestamps.dt.day,
+                                                       timestamps.dt.month, timestamps.dt.year]):
+                        if col in needed:
+                            columns[col] = values.array
+            elif kind == 'encode':
+                label_encoder = LabelEncoder()
+                for col in arg:
+                    if col in needed:
+                        columns[col] = label_encoder.fit_transform(series(col).astype(str))
+            elif kind == 'impute' and arg == 'remove':
+                keep = np.ones(len(index), dtype=bool)
+                for col in columns:
+                    keep &= series(col).notna().to_numpy()
+                index = index[keep]
+                columns = {col: values[keep] for col, values in columns.items()}
+            elif kind == 'impute':
+                candidates = [col for col in final_schema if col in columns and col in needed]
+                empty = pd.DataFrame({col: columns[col][:0] for col in candidates})
+                numeric_cols = empty.select_dtypes(include=[np.number]).columns
+                if len(numeric_cols):
+                    imputed = SimpleImputer(strategy=arg).fit_transform(
+                        pd.DataFrame({col: series(col) for col in numeric_cols}))
+                    columns.update({col: imputed[:, j] for j, col in enumerate(numeric_cols)})
+            elif kind == 'normalize':
+                numerical_cols, method = arg
+                scale_cols = [col for col in numerical_cols if col in needed]
+                if scale_cols:
+                    scaler = StandardScaler() if method == 'standardize' else MinMaxScaler()
+                    scaled = scaler.fit_transform(pd.DataFrame({col: series(col) for col in scale_cols}))
+                    columns.update({col: scaled[:, j] for j, col in enumerate(scale_cols)})
+
+            columns = {col: values for col, values in columns.items() if col in needed}
+
+        return pd.DataFrame({col: columns[col] for col in output_cols}, index=index)
+
 
 # ====== Example Usage ======
 if __name__ == '__main__':
@@ -129,4 +336,7 @@ if __name__ == '__main__':
         exit()
 
     print("✅ Feature engineering completed successfully.")
+    if profiler.enabled:
+        profiler.write_report('feature_engineering_profile.json')
+        print("✅ Stage profile written to 'feature_engineering_profile.json'.")
     print("===============================================")
@@ -0,0 +1,196 @@
+import functools
+import json
+import logging
+import os
+import time
+import tracemalloc
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+def _frame_memory(frame, deep: bool):
+    if isinstance(frame, pd.DataFrame):
+        return int(frame.memory_usage(index=True, deep=deep).sum())
+    if isinstance(frame, pd.Series):
+        return int(frame.memory_usage(index=True, deep=deep))
+    return None
+
+
+def _find_frame(values):
+    """Returns the first DataFrame (or Series) among `values`, if any."""
+    for value in values:
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            return value
+    return None
+
+
+class _NullStage:
+    """Stage returned while profiling is disabled; every operation is a no-op."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def output(self, frame):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    """A single profiled step, recording wall time, rows, frame memory and tracemalloc peak."""
+
+    def __init__(self, profiler, name: str, frame=None):
+        self.profiler = profiler
+        self.record = {'stage': name, 'depth': len(profiler._stack)}
+        self.input_frame = frame
+        self.output_frame = None
+        self.child_peak = 0
+
+    def output(self, frame):
+        """Registers the DataFrame produced by this stage."""
+        self.output_frame = frame
+
+    def __enter__(self):
+        profiler = self.profiler
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            profiler._owns_tracemalloc = True
+        if profiler._stack:
+            parent = profiler._stack[-1]
+            parent.child_peak = max(parent.child_peak, tracemalloc.get_traced_memory()[1])
+
+        frame = self.input_frame
+        self.record['rows_in'] = len(frame) if frame is not None else None
+        self.record['memory_in_bytes'] = _frame_memory(frame, profiler.deep_memory)
+        self.input_frame = None
+
+        # A caller that started tracemalloc itself keeps its peak; stage peaks are then upper bounds
+        if profiler._owns_tracemalloc:
+            tracemalloc.reset_peak()
+        self.start_traced = tracemalloc.get_traced_memory()[0]
+        profiler._stack.append(self)
+        self.start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        wall_time = time.perf_counter() - self.start_time
+        profiler = self.profiler
+        peak = max(tracemalloc.get_traced_memory()[1], self.child_peak)
+        profiler._stack.pop()
+
+        frame = self.output_frame
+        self.record.update({
+            'wall_time_s': wall_time,
+            'rows_out': len(frame) if frame is not None else None,
+            'memory_out_bytes': _frame_memory(frame, profiler.deep_memory),
+            'tracemalloc_peak_bytes': max(peak - self.start_traced, 0),
+            'failed': exc_type is not None,
+        })
+        self.output_frame = None
+        profiler.records.append(self.record)
+        logger.info(json.dumps(self.record))
+
+        if profiler._stack:
+            parent = profiler._stack[-1]
+            parent.child_peak = max(parent.child_peak, peak)
+            if profiler._owns_tracemalloc:
+                tracemalloc.reset_peak()
+        elif profiler._owns_tracemalloc:
+            tracemalloc.stop()
+            profiler._owns_tracemalloc = False
+        return False
+
+
+class StageProfiler:
+    """
+    Opt-in per-stage profiler for feature engineering and RFM runs.
+
+    Enable it with `profiler.enable()` or by setting the CREDIT_RISK_PROFILE environment variable.
+    The profiler only resets the tracemalloc peak when it started tracing itself; if tracemalloc
+    was already running, the caller's peak is left intact and each stage's peak is an upper bound.
+    While disabled, profiled functions run with a single flag check of overhead.
+    """
+
+    def __init__(self):
+        self.enabled = os.getenv('CREDIT_RISK_PROFILE', '').lower() in ('1', 'true', 'yes')
+        self.deep_memory = False
+        self.records = []
+        self._stack = []
+        self._owns_tracemalloc = False
+
+    def enable(self, deep_memory: bool = False):
+        """
+        Turns profiling on.
+
+        Parameters:
+        -----------
+        deep_memory : bool
+            Measure object columns with `memory_usage(deep=True)`. Accurate but O(rows) per stage.
+        """
+        self.enabled = True
+        self.deep_memory = deep_memory
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        self.records = []
+
+    def stage(self, name: str, frame=None):
+        """
+        Context manager profiling the enclosed block as one stage.
+
+        Example:
+        --------
+        with profiler.stage('load', df) as stage:
+            df = transform(df)
+            stage.output(df)
+        """
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name, frame)
+
+    def report(self) -> list:
+        """Returns the recorded stages in completion order."""
+        return list(self.records)
+
+    def write_report(self, path: str):
+        """Writes the recorded stages to a JSON file."""
+        with open(path, 'w') as f:
+            json.dump(self.records, f, indent=2)
+
+
+profiler = StageProfiler()
+
+
+def profile_stage(func=None, *, name: str = None):
+    """
+    Decorator profiling each call of `func` as a stage of the module-level profiler.
+
+    Rows and memory in are taken from the first DataFrame argument (or, for methods, the first
+    DataFrame attribute of the instance); rows and memory out from the returned DataFrame.
+    """
+    if func is None:
+        return functools.partial(profile_stage, name=name)
+    stage_name = name or func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not profiler.enabled:
+            return func(*args, **kwargs)
+
+        frame = _find_frame(list(args) + list(kwargs.values()))
+        if frame is None and args and hasattr(args[0], '__dict__'):
+            frame = _find_frame(vars(args[0]).values())
+        with profiler.stage(stage_name, frame) as stage:
+            result = func(*args, **kwargs)
+            stage.output(_find_frame(result if isinstance(result, tuple) else (result,)))
+        return result
+
+    return wrapper
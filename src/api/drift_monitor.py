@@ -0,0 +1,266 @@
+import bisect
+import json
+import math
+import threading
+import time
+import weakref
+
+import numpy as np
+
+NUMERIC_FEATURES = ["Amount", "Value"]
+CATEGORICAL_FEATURES = ["ProductCategory", "ChannelId", "CountryCode"]
+
+# Same smoothing as CreditScoreRFM.calculate_woe, to avoid log(0) on empty bins
+EPSILON = 1e-10
+
+# Conventional PSI cut-offs for a stable / moderately shifted / significantly shifted feature
+PSI_MODERATE = 0.1
+PSI_SIGNIFICANT = 0.25
+
+OTHER_CATEGORY = "__other__"
+MISSING_BIN = "__missing__"
+
+
+class _ShardHolder:
+    """Per-thread owner of a counter shard, tracked with a weakref to notice thread exit."""
+
+    __slots__ = ("counts", "__weakref__")
+
+    def __init__(self, counts: list):
+        self.counts = counts
+
+
+class DriftMonitor:
+    """
+    Counts served inputs into fixed, training-derived bins and reports PSI and WoE shift per feature.
+
+    Each thread increments its own counter shard, so recording takes no lock. When a thread exits
+    its shard is folded into a retired total, so memory is bounded by the number of bins times the
+    number of live worker threads.
+    """
+
+    def __init__(self, profile: dict, refresh_seconds: float = 60.0):
+        """
+        Parameters:
+        -----------
+        profile : dict
+            Per-feature training bins, as produced by `build_profile`.
+        refresh_seconds : float
+            How long a computed report is reused before it is recomputed.
+        """
+        self.profile = profile
+        self.refresh_seconds = refresh_seconds
+
+        self._features = []
+        offset = 0
+        for feature, spec in profile.items():
+            if spec["type"] == "numeric":
+                lookup = [float(edge) for edge in spec["edges"]]
+            else:
+                lookup = {category: i for i, category in enumerate(spec["categories"])}
+            size = len(spec["expected"])
+            self._features.append((feature, spec["type"], lookup, offset, size))
+            offset += size
+        self._n_counters = offset
+
+        self._local = threading.local()
+        self._shards = {}
+        self._retired = np.zeros(self._n_counters, dtype=np.int64)
+        self._shards_lock = threading.Lock()
+        self._report = None
+        self._report_time = 0.0
+
+    # ---- Profile construction -------------------------------------------------------------
+
+    @staticmethod
+    def build_profile(
+        df,
+        numeric_features=None,
+        categorical_features=None,
+        n_bins: int = 10,
+        max_categories: int = 50,
+    ) -> dict:
+        """
+        Derives fixed bins and expected bin proportions from training data.
+
+        Numeric features get quantile bins plus a missing-value bin. Categorical features keep their
+        `max_categories` most frequent values plus an 'other' bin for everything else.
+        """
+        numeric_features = (
+            NUMERIC_FEATURES if numeric_features is None else numeric_features
+        )
+        categorical_features = (
+            CATEGORICAL_FEATURES
+            if categorical_features is None
+            else categorical_features
+        )
+        n_rows = len(df)
+        if n_rows == 0:
+            raise ValueError("Cannot build a drift profile from an empty DataFrame.")
+
+        profile = {}
+        for feature in numeric_features:
+            values = df[feature].to_numpy(dtype=np.float64, na_value=np.nan)
+            present = values[~np.isnan(values)]
+            if present.size:
+                edges = np.unique(
+                    np.quantile(present, np.linspace(0, 1, n_bins + 1)[1:-1])
+                )
+            else:
+                edges = np.array([], dtype=np.float64)
+            counts = np.bincount(
+                np.searchsorted(edges, present, side="right"), minlength=len(edges) + 1
+            )
+            expected = np.append(counts, values.size - present.size) / n_rows
+            profile[feature] = {
+                "type": "numeric",
+                "edges": edges.tolist(),
+                "expected": expected.tolist(),
+            }
+
+        for feature in categorical_features:
+            frequencies = df[feature].astype(str).value_counts()
+            top = frequencies.iloc[:max_categories]
+            expected = (
+                np.append(top.to_numpy(), frequencies.iloc[max_categories:].sum())
+                / n_rows
+            )
+            profile[feature] = {
+                "type": "categorical",
+                "categories": top.index.tolist(),
+                "expected": expected.tolist(),
+            }
+        return profile
+
+    @classmethod
+    def from_training_data(cls, df, **kwargs) -> "DriftMonitor":
+        refresh_seconds = kwargs.pop("refresh_seconds", 60.0)
+        return cls(cls.build_profile(df, **kwargs), refresh_seconds=refresh_seconds)
+
+    def save(self, path: str):
+        """Writes the training profile (not the served counts) to JSON."""
+        with open(path, "w") as f:
+            json.dump(self.profile, f)
+
+    @classmethod
+    def load(cls, path: str, refresh_seconds: float = 60.0) -> "DriftMonitor":
+        with open(path) as f:
+            return cls(json.load(f), refresh_seconds=refresh_seconds)
+
+    # ---- Recording ------------------------------------------------------------------------
+
+    def _shard(self) -> list:
+        holder = getattr(self._local, "holder", None)
+        if holder is None:
+            holder = _ShardHolder([0] * self._n_counters)
+            with self._shards_lock:
+                self._shards[id(holder)] = holder.counts
+            # The thread-local holder is dropped when its thread exits
+            weakref.finalize(holder, self._retire, id(holder))
+            self._local.holder = holder
+        return holder.counts
+
+    def _retire(self, key: int):
+        with self._shards_lock:
+            self._retired += np.asarray(self._shards.pop(key), dtype=np.int64)
+
+    def record(self, values: dict):
+        """Counts one served input, given as a mapping of feature name to raw value."""
+        shard = self._shard()
+        for feature, kind, lookup, offset, size in self._features:
+            value = values.get(feature)
+            if kind == "numeric":
+                if value is None or value != value:
+                    index = size - 1
+                else:
+                    index = bisect.bisect_right(lookup, value)
+            else:
+                index = lookup.get(str(value), size - 1)
+            shard[offset + index] += 1
+
+    def record_batch(self, df):
+        """Counts a DataFrame of served inputs with vectorized binning."""
+        shard = self._shard()
+        for feature, kind, lookup, offset, size in self._features:
+            if feature not in df.columns:
+                continue
+            if kind == "numeric":
+                values = df[feature].to_numpy(dtype=np.float64, na_value=np.nan)
+                indices = np.searchsorted(lookup, values, side="right")
+                indices[np.isnan(values)] = size - 1
+            else:
+                codes = df[feature].astype(str).map(lookup)
+                indices = codes.fillna(size - 1).to_numpy(dtype=np.int64)
+            for i, count in enumerate(np.bincount(indices, minlength=size).tolist()):
+                shard[offset + i] += count
+
+    # ---- Reporting ------------------------------------------------------------------------
+
+    def counts(self) -> np.ndarray:
+        """Sums the per-thread shards into one counter array."""
+        with self._shards_lock:
+            total = self._retired.copy()
+            for shard in self._shards.values():
+                total += np.asarray(shard, dtype=np.int64)
+        return total
+
+    def _bin_labels(self, feature: str) -> list:
+        spec = self.profile[feature]
+        if spec["type"] == "categorical":
+            return spec["categories"] + [OTHER_CATEGORY]
+        bounds = [-math.inf] + spec["edges"] + [math.inf]
+        return [f"[{lo}, {hi})" for lo, hi in zip(bounds[:-1], bounds[1:])] + [
+            MISSING_BIN
+        ]
+
+    def compute_report(self) -> dict:
+        """Computes PSI and per-bin WoE shift of the served distribution against the training one."""
+        counts = self.counts()
+        features = {}
+        for feature, _, _, offset, size in self._features:
+            actual_counts = counts[slice(offset, offset + size)]
+            n_served = int(actual_counts.sum())
+            expected = np.asarray(self.profile[feature]["expected"], dtype=np.float64)
+            if n_served == 0:
+                features[feature] = {
+                    "observations": 0,
+                    "psi": None,
+                    "status": "no_data",
+                    "bins": [],
+                }
+                continue
+
+            actual = actual_counts / n_served
+            woe = np.log((actual + EPSILON) / (expected + EPSILON))
+            psi = float(np.sum((actual - expected) * woe))
+            if psi >= PSI_SIGNIFICANT:
+                status = "significant"
+            elif psi >= PSI_MODERATE:
+                status = "moderate"
+            else:
+                status = "stable"
+            features[feature] = {
+                "observations": n_served,
+                "psi": psi,
+                "status": status,
+                "bins": [
+                    {
+                        "bin": label,
+                        "expected": float(e),
+                        "actual": float(a),
+                        "woe": float(w),
+                    }
+                    for label, e, a, w in zip(
+                        self._bin_labels(feature), expected, actual, woe
+                    )
+                ],
+            }
+        return {"generated_at": time.time(), "features": features}
+
+    def report(self) -> dict:
+        """Returns the latest report, recomputing it at most once every `refresh_seconds`."""
+        now = time.monotonic()
+        if self._report is None or now - self._report_time >= self.refresh_seconds:
+            self._report = self.compute_report()
+            self._report_time = now
+        return self._report
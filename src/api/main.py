@@ -1,9 +1,13 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request
 from pydantic_models import PredictionInput, PredictionOutput
+from drift_monitor import DriftMonitor
+from risk_index import RiskIndex
+import streaming
 import mlflow
 import pandas as pd
 import numpy as np
 import logging
+import os
 from typing import List
 
 app = FastAPI(title="Credit Risk API", version="1.0.0")
@@ -21,12 +25,35 @@ except Exception as e:
     logger.error(f"Model loading failed: {str(e)}")
     raise
 
+# Training-derived drift profile (build with DriftMonitor.from_training_data(...).save(path))
+DRIFT_PROFILE_PATH = os.getenv("DRIFT_PROFILE_PATH", "drift_profile.json")
+
+drift_monitor = None
+if os.path.exists(DRIFT_PROFILE_PATH):
+    drift_monitor = DriftMonitor.load(DRIFT_PROFILE_PATH)
+    logger.info(f"Loaded drift profile from {DRIFT_PROFILE_PATH}")
+else:
+    logger.warning(f"No drift profile at {DRIFT_PROFILE_PATH}; drift monitoring disabled")
+
+# Precomputed per-customer risk (build with scripts/build_risk_index.py)
+RISK_INDEX_PATH = os.getenv("RISK_INDEX_PATH", "risk_index")
+
+risk_index = RiskIndex(RISK_INDEX_PATH)
+if risk_index.available:
+    logger.info(f"Loaded risk index for {len(risk_index)} customers from {RISK_INDEX_PATH}")
+else:
+    logger.warning(f"No risk index at {RISK_INDEX_PATH} yet; customer risk lookup unavailable")
+
 @app.post("/predict", response_model=PredictionOutput)
 async def predict(data: PredictionInput):
     """Make risk predictions for customer transactions"""
     try:
         # Convert input to DataFrame
-        input_df = pd.DataFrame([data.dict()])
+        payload = data.dict()
+        input_df = pd.DataFrame([payload])
+
+        if drift_monitor is not None:
+            drift_monitor.record(payload)
         
         # Preprocess and predict
         prediction = model.predict(input_df)
@@ -46,6 +73,43 @@ async def predict(data: PredictionInput):
         logger.error(f"Prediction failed: {str(e)}")
         # raise HTTPException(status_code=400, detail=str(e))
 
+@app.post("/predict/stream")
+async def predict_stream(request: Request):
+    """Score a chunked NDJSON body or an Arrow IPC stream of PredictionInput columns"""
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    scorer = streaming.StreamScorer(model, model.metadata.run_id, drift_monitor)
+
+    if content_type == streaming.NDJSON_MEDIA_TYPE:
+        results = streaming.stream_ndjson(request.stream(), scorer.score)
+    elif content_type == streaming.ARROW_STREAM_MEDIA_TYPE and streaming.pa is not None:
+        try:
+            results = await streaming.open_arrow_stream(request.stream(), scorer.score)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid Arrow IPC stream: {e}")
+    else:
+        raise HTTPException(
+            status_code=415,
+            detail=f"Unsupported content type: {content_type or 'none'}",
+        )
+    return streaming.BodyStreamingResponse(results, media_type=content_type)
+
+@app.get("/customers/{customer_id}/risk", response_model=PredictionOutput)
+async def customer_risk(customer_id: str):
+    """Look up the precomputed risk of a customer"""
+    result = risk_index.lookup(customer_id)
+    if result is None:
+        if not risk_index.available:
+            raise HTTPException(status_code=503, detail="Customer risk index is not available")
+        raise HTTPException(status_code=404, detail=f"Unknown customer: {customer_id}")
+    return result
+
+@app.get("/drift")
+async def drift_report():
+    """PSI and WoE shift of served inputs against the training distribution"""
+    if drift_monitor is None:
+        raise HTTPException(status_code=404, detail="Drift monitoring is disabled")
+    return drift_monitor.report()
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
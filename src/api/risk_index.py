@@ -0,0 +1,163 @@
+import json
+import os
+import shutil
+import time
+
+import numpy as np
+
+# Same cut-off as the /predict endpoint
+HIGH_RISK_THRESHOLD = 0.5
+RISK_CATEGORIES = ("low", "high")
+
+IDS_FILE = "ids.npy"
+PROBABILITIES_FILE = "probabilities.npy"
+CATEGORIES_FILE = "categories.npy"
+META_FILE = "meta.json"
+
+# Each build is written to `<path>.v<timestamp>` and `path` is a symlink to the latest one
+VERSION_SUFFIX = ".v"
+
+
+def write_risk_index(path: str, customer_ids, probabilities, model_version: str):
+    """
+    Writes a sorted customer risk index that `RiskIndex` can memory-map.
+
+    The index is a directory of three aligned .npy arrays (fixed-width UTF-8 ids sorted
+    bytewise, float32 probabilities and uint8 risk categories) plus a small JSON header.
+    Each build goes to its own versioned directory next to `path`, and `path` is then
+    atomically repointed to it, so readers never see a missing or partial index.
+
+    Parameters:
+    -----------
+    path : str
+        Location of the index; becomes a symlink to the latest version.
+    customer_ids : array-like
+        One id per customer; must be unique.
+    probabilities : array-like
+        Probability of high risk for each customer.
+    model_version : str
+        Identifier of the model that produced the probabilities.
+    """
+    ids = np.char.encode(np.asarray(customer_ids).astype(str), "utf-8")
+    probabilities = np.asarray(probabilities, dtype=np.float32)
+    if ids.shape != probabilities.shape:
+        raise ValueError("customer_ids and probabilities must have the same length.")
+
+    order = np.argsort(ids, kind="stable")
+    ids = ids[order]
+    probabilities = probabilities[order]
+    if ids.size and np.any(ids[1:] == ids[:-1]):
+        raise ValueError("customer_ids must be unique.")
+    categories = (probabilities >= HIGH_RISK_THRESHOLD).astype(np.uint8)
+
+    version_dir = f"{path}{VERSION_SUFFIX}{time.time_ns()}"
+    os.makedirs(version_dir)
+    np.save(os.path.join(version_dir, IDS_FILE), ids)
+    np.save(os.path.join(version_dir, PROBABILITIES_FILE), probabilities)
+    np.save(os.path.join(version_dir, CATEGORIES_FILE), categories)
+    meta = {
+        "model_version": model_version,
+        "n_customers": int(ids.size),
+        "created_at": time.time(),
+    }
+    with open(os.path.join(version_dir, META_FILE), "w") as f:
+        json.dump(meta, f)
+
+    # Indexes written before versioning were plain directories; move them aside once
+    if os.path.isdir(path) and not os.path.islink(path):
+        os.rename(path, f"{path}{VERSION_SUFFIX}0")
+
+    # Swap the symlink atomically, so `path` always resolves to a complete index
+    link_tmp = f"{path}.link-{os.getpid()}"
+    if os.path.lexists(link_tmp):
+        os.remove(link_tmp)
+    os.symlink(os.path.basename(version_dir), link_tmp)
+    os.replace(link_tmp, path)
+    _remove_old_versions(path)
+
+
+def _remove_old_versions(path: str):
+    """Deletes index versions older than the previous one, which readers may still be opening."""
+    parent, name = os.path.split(os.path.abspath(path))
+    prefix = name + VERSION_SUFFIX
+    versions = sorted(
+        (int(entry.removeprefix(prefix)), entry)
+        for entry in os.listdir(parent)
+        if entry.startswith(prefix) and entry.removeprefix(prefix).isdigit()
+    )
+    for _, entry in versions[:-2]:
+        shutil.rmtree(os.path.join(parent, entry), ignore_errors=True)
+
+
+class RiskIndex:
+    """
+    Read-only view of a customer risk index, memory-mapped so every worker shares the
+    same pages and lookups are a binary search over the sorted ids.
+
+    Every `refresh_seconds` a lookup checks which version `path` points to and maps the
+    new one after a rebuild, so workers pick up rebuilt indexes without a restart. An
+    index that does not exist yet is picked up the same way.
+    """
+
+    def __init__(self, path: str, refresh_seconds: float = 5.0):
+        self.path = path
+        self.refresh_seconds = refresh_seconds
+        self._state = None
+        self._checked_at = 0.0
+        self.refresh()
+
+    @property
+    def available(self) -> bool:
+        return self._state is not None
+
+    @property
+    def model_version(self):
+        return self._state[1]["model_version"] if self._state else None
+
+    @property
+    def ids(self):
+        """Sorted, memory-mapped ids of the currently mapped version."""
+        return self._state[2] if self._state else None
+
+    def refresh(self):
+        """Maps the index version that `path` currently points to, if it changed."""
+        self._checked_at = time.monotonic()
+        version_dir = os.path.realpath(self.path)
+        if self._state is not None and self._state[0] == version_dir:
+            return
+        if not os.path.exists(os.path.join(version_dir, META_FILE)):
+            return
+        with open(os.path.join(version_dir, META_FILE)) as f:
+            meta = json.load(f)
+        arrays = [
+            np.load(os.path.join(version_dir, name), mmap_mode="r")
+            for name in (IDS_FILE, PROBABILITIES_FILE, CATEGORIES_FILE)
+        ]
+        # Swapped in as one tuple so concurrent lookups never mix two versions
+        self._state = (version_dir, meta, *arrays)
+
+    def __len__(self):
+        return len(self._state[2]) if self._state else 0
+
+    def lookup(self, customer_id: str):
+        """Returns the stored risk of `customer_id`, or None if it is not indexed."""
+        if time.monotonic() - self._checked_at >= self.refresh_seconds:
+            self.refresh()
+        state = self._state
+        if state is None:
+            return None
+        _, meta, ids, probabilities, categories = state
+
+        key = customer_id.encode("utf-8")
+        if not key or len(key) > ids.dtype.itemsize:
+            return None
+        key = np.array(key, dtype=ids.dtype)
+        i = int(np.searchsorted(ids, key))
+        if i == len(ids) or ids[i] != key:
+            return None
+        return {
+            "customer_id": customer_id,
+            "risk_probability": float(probabilities[i]),
+            "risk_category": RISK_CATEGORIES[categories[i]],
+            "model_version": meta["model_version"],
+        }
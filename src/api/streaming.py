@@ -0,0 +1,315 @@
+import asyncio
+import io
+import json
+import queue
+
+import numpy as np
+import pandas as pd
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+from starlette.requests import ClientDisconnect
+from starlette.responses import StreamingResponse
+
+from pydantic_models import PredictionInput
+
+try:
+    import pyarrow as pa
+    from pyarrow import json as pa_json
+except ImportError:  # Arrow IPC needs pyarrow; NDJSON falls back to pandas
+    pa = None
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# Column types of a prediction request, validated per column instead of per row
+INPUT_COLUMNS = dict(PredictionInput.__annotations__)
+RESULT_COLUMNS = [
+    "customer_id",
+    "risk_probability",
+    "risk_category",
+    "model_version",
+    "error",
+]
+
+# Same cut-off as the /predict endpoint
+HIGH_RISK_THRESHOLD = 0.5
+
+# NDJSON input is parsed and scored in batches of at least this many bytes
+NDJSON_BATCH_BYTES = 1 << 20
+
+
+def validate_frame(frame: pd.DataFrame):
+    """
+    Validates and coerces the PredictionInput columns of `frame` with vectorized checks.
+
+    Returns:
+    --------
+    tuple
+        The coerced input columns, a boolean mask of valid rows, and the per-row error
+        message (None for valid rows).
+    """
+    n_rows = len(frame)
+    clean = {}
+    invalid = np.zeros(n_rows, dtype=bool)
+    errors = np.full(n_rows, None, dtype=object)
+    for col, kind in INPUT_COLUMNS.items():
+        if col not in frame.columns:
+            bad = np.ones(n_rows, dtype=bool)
+            clean[col] = pd.Series(np.full(n_rows, np.nan if kind is float else None))
+        elif kind is float:
+            values = pd.to_numeric(frame[col], errors="coerce").astype(np.float64)
+            bad = ~np.isfinite(values.to_numpy())
+            clean[col] = values
+        else:
+            bad = frame[col].isna().to_numpy()
+            clean[col] = frame[col].astype(str)
+        errors[bad & ~invalid] = f"Invalid or missing value for '{col}'"
+        invalid |= bad
+
+    clean = pd.DataFrame({col: values.to_numpy() for col, values in clean.items()})
+    return clean, ~invalid, errors
+
+
+class StreamScorer:
+    """
+    Scores whole batches of prediction inputs, recording valid rows in the drift monitor.
+    """
+
+    def __init__(self, model, model_version: str, drift_monitor=None):
+        self.model = model
+        self.model_version = model_version
+        self.drift_monitor = drift_monitor
+
+    def score(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Returns one result row per input row, in the shape of PredictionOutput plus 'error'."""
+        clean, valid, errors = validate_frame(frame)
+        probabilities = np.full(len(clean), np.nan)
+        if valid.any():
+            batch = clean if valid.all() else clean[valid]
+            if self.drift_monitor is not None:
+                self.drift_monitor.record_batch(batch)
+            probabilities[valid] = self.model.predict_proba(batch)[:, 1]
+
+        categories = np.where(probabilities >= HIGH_RISK_THRESHOLD, "high", "low")
+        customer_ids = None
+        if "AccountId" in frame.columns:
+            customer_ids = np.where(
+                frame["AccountId"].notna(), clean["AccountId"], None
+            )
+        return pd.DataFrame(
+            {
+                "customer_id": customer_ids,
+                "risk_probability": probabilities,
+                "risk_category": np.where(valid, categories, None),
+                "model_version": self.model_version,
+                "error": errors,
+            },
+            columns=RESULT_COLUMNS,
+        )
+
+
+class BodyStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse whose body iterator is still reading the request body.
+
+    The stock response listens for client disconnects on `receive`, which would swallow
+    request body chunks; here disconnects surface through `request.stream()` instead.
+    """
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await self.stream_response(send)
+        except OSError:
+            raise ClientDisconnect()
+        if self.background is not None:
+            await self.background()
+
+
+# ---- NDJSON -------------------------------------------------------------------------------
+
+
+def _read_ndjson(data: bytes) -> pd.DataFrame:
+    if pa is not None:
+        try:
+            return pa_json.read_json(io.BytesIO(data)).to_pandas()
+        except pa.ArrowInvalid:
+            # pyarrow infers one type per column; rows of another type are left to validation
+            pass
+    return pd.read_json(io.BytesIO(data), lines=True, dtype=False, convert_dates=False)
+
+
+def _score_ndjson_lines(data: bytes, score) -> pd.DataFrame:
+    """
+    Scores a batch containing unparsable lines, returning one result per non-blank line
+    so results stay aligned with the input.
+    """
+    lines = [line for line in data.splitlines() if line.strip()]
+    records = []
+    parsed = np.zeros(len(lines), dtype=bool)
+    for i, line in enumerate(lines):
+        try:
+            record = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(record, dict):
+            records.append(record)
+            parsed[i] = True
+
+    results = pd.DataFrame(
+        {
+            "customer_id": np.full(len(lines), None, dtype=object),
+            "risk_probability": np.full(len(lines), np.nan),
+            "risk_category": np.full(len(lines), None, dtype=object),
+            "model_version": np.full(len(lines), None, dtype=object),
+            "error": np.full(len(lines), "Malformed NDJSON line", dtype=object),
+        },
+        columns=RESULT_COLUMNS,
+    )
+    if records:
+        scored = score(pd.DataFrame.from_records(records))
+        for col in RESULT_COLUMNS:
+            results.loc[parsed, col] = scored[col].to_numpy()
+    return results
+
+
+def _score_ndjson(data: bytes, score) -> bytes:
+    try:
+        frame = _read_ndjson(data)
+    except (ValueError, TypeError):
+        # pandas raises TypeError for lines that are valid JSON but not objects
+        results = _score_ndjson_lines(data, score)
+    else:
+        results = score(frame)
+    output = results.to_json(orient="records", lines=True)
+    return (output if output.endswith("\n") else output + "\n").encode()
+
+
+async def stream_ndjson(chunks, score, batch_bytes: int = NDJSON_BATCH_BYTES):
+    """
+    Scores a chunked NDJSON body, yielding NDJSON results as soon as each batch of
+    complete lines has arrived.
+    """
+    pending = bytearray()
+    async for chunk in chunks:
+        pending.extend(chunk)
+        if len(pending) < batch_bytes:
+            continue
+        cut = pending.rfind(b"\n") + 1
+        if cut:
+            data = bytes(pending[:cut])
+            del pending[:cut]
+            yield await run_in_threadpool(_score_ndjson, data, score)
+    if bytes(pending).strip():
+        yield await run_in_threadpool(_score_ndjson, bytes(pending), score)
+
+
+# ---- Arrow IPC ----------------------------------------------------------------------------
+
+
+class _ChunkQueueReader(io.RawIOBase):
+    """Blocking file-like view over body chunks pushed from the event loop."""
+
+    def __init__(self, max_chunks: int = 16):
+        super().__init__()
+        self._chunks = queue.Queue(maxsize=max_chunks)
+        self._buffer = b""
+        self._eof = False
+        self._abandoned = False
+
+    def readable(self):
+        return True
+
+    def put(self, chunk):
+        """Queues a body chunk; None marks the end of the body."""
+        while not self._abandoned:
+            try:
+                self._chunks.put(chunk, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def abandon(self):
+        """Stops reading; chunks put afterwards are discarded instead of blocking."""
+        self._abandoned = True
+
+    def readinto(self, buffer):
+        while not self._buffer and not self._eof:
+            chunk = self._chunks.get()
+            if chunk is None:
+                self._eof = True
+            else:
+                self._buffer = chunk
+        n = min(len(buffer), len(self._buffer))
+        buffer[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+
+def _result_schema():
+    return pa.schema(
+        [
+            ("customer_id", pa.string()),
+            ("risk_probability", pa.float64()),
+            ("risk_category", pa.string()),
+            ("model_version", pa.string()),
+            ("error", pa.string()),
+        ]
+    )
+
+
+def _score_arrow(reader, body, score):
+    schema = _result_schema()
+    sink = io.BytesIO()
+    try:
+        with pa.ipc.new_stream(sink, schema) as writer:
+            for batch in reader:
+                results = score(batch.to_pandas())
+                writer.write_batch(
+                    pa.RecordBatch.from_pandas(
+                        results, schema=schema, preserve_index=False
+                    )
+                )
+                yield sink.getvalue()
+                sink.seek(0)
+                sink.truncate()
+        yield sink.getvalue()
+    finally:
+        body.abandon()
+
+
+async def _feed(chunks, body):
+    try:
+        async for chunk in chunks:
+            await run_in_threadpool(body.put, chunk)
+    finally:
+        await run_in_threadpool(body.put, None)
+
+
+async def _stream_arrow_results(reader, body, feeder, score):
+    try:
+        async for output in iterate_in_threadpool(_score_arrow(reader, body, score)):
+            yield output
+        await feeder
+    finally:
+        feeder.cancel()
+
+
+async def open_arrow_stream(chunks, score):
+    """
+    Starts reading an Arrow IPC stream with the PredictionInput columns and returns an
+    async iterator yielding an Arrow IPC stream of results, batch by batch as record
+    batches arrive.
+
+    The stream's schema is read before returning, so a body that is not an Arrow IPC
+    stream raises ValueError while an error response can still be sent.
+    """
+    if pa is None:
+        raise RuntimeError("pyarrow is required to score Arrow IPC streams.")
+    body = _ChunkQueueReader()
+    feeder = asyncio.ensure_future(_feed(chunks, body))
+    try:
+        reader = await run_in_threadpool(pa.ipc.open_stream, io.BufferedReader(body))
+    except BaseException:
+        body.abandon()
+        feeder.cancel()
+        raise
+    return _stream_arrow_results(reader, body, feeder, score)
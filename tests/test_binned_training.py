@@ -0,0 +1,103 @@
+import unittest
+import pandas as pd
+import numpy as np
+import os
+import sys
+import tempfile
+import tracemalloc
+from sklearn.ensemble import HistGradientBoostingClassifier
+
+# Add the scripts directory to the path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "scripts"))
+)
+from binned_training import BinnedGradientBoostingModel
+
+
+class TestBinnedTraining(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an imbalanced sample dataset for testing."""
+        rng = np.random.default_rng(0)
+        n = 400
+        self.X = pd.DataFrame({
+            'Amount': rng.normal(1000, 300, n),
+            'Frequency': rng.integers(1, 50, n),
+            'ChannelId': rng.integers(0, 3, n),
+        })
+        self.y = (self.X['Amount'] + rng.normal(0, 100, n) > 1350).astype(int)
+
+    def test_transform_is_uint8_with_stored_edges(self):
+        """Test that features map onto the stored edges as a uint8 matrix."""
+        model = BinnedGradientBoostingModel(max_bins=16, max_iter=5).fit(self.X, self.y)
+        binned = model.transform(self.X)
+        self.assertEqual(binned.dtype, np.uint8)
+        self.assertEqual(binned.shape, self.X.shape)
+        self.assertLess(binned[:, 0].max(), 16)
+        self.assertEqual(list(model.bin_edges), ['Amount', 'Frequency', 'ChannelId'])
+        np.testing.assert_array_equal(
+            binned[:, 0], np.searchsorted(model.bin_edges['Amount'], self.X['Amount'], side='left'))
+
+    def test_low_cardinality_columns_keep_one_bin_per_value(self):
+        """Test that label-encoded columns are not merged into shared bins."""
+        model = BinnedGradientBoostingModel(max_iter=5).fit(self.X, self.y)
+        np.testing.assert_array_equal(model.transform(self.X)[:, 2], self.X['ChannelId'].to_numpy())
+
+    def test_missing_values_learn_their_own_direction(self):
+        """Test that NaNs use a reserved bin instead of sharing the top bin."""
+        X = self.X.copy()
+        y = self.y.copy()
+        # Missing amounts are high risk although low amounts are not
+        X.loc[X.index[:60], 'Amount'] = np.nan
+        y.iloc[:60] = 1
+        model = BinnedGradientBoostingModel(max_iter=30).fit(X, y)
+
+        self.assertTrue((model.transform(X.head(60))[:, 0] == model.missing_bin).all())
+        proba = model.predict_proba(X)[:, 1]
+        self.assertGreater(proba[:60].min(), 0.5)
+        top = X['Amount'] >= X['Amount'].quantile(0.99)
+        self.assertTrue((proba[top.to_numpy()] > 0.5).all())
+        low = X['Amount'] <= X['Amount'].quantile(0.2)
+        self.assertTrue((proba[low.to_numpy()] < 0.5).all())
+
+    def test_model_reuses_training_bin_edges(self):
+        """Test fitting, scoring with stored edges, and a save/load round trip."""
+        model = BinnedGradientBoostingModel(max_iter=20).fit(self.X, self.y)
+        proba = model.predict_proba(self.X)
+        self.assertEqual(proba.shape, (len(self.X), 2))
+        self.assertGreater(((proba[:, 1] >= 0.5) == self.y).mean(), 0.8)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'binned_model.pkl')
+            model.save(path)
+            restored = BinnedGradientBoostingModel.load(path)
+        np.testing.assert_allclose(restored.predict_proba(self.X), proba)
+        for col, edges in model.bin_edges.items():
+            np.testing.assert_array_equal(restored.bin_edges[col], edges)
+
+    def test_fit_keeps_no_extra_copy_of_the_features(self):
+        """Test that training allocates well below the classifier's default fit."""
+        rng = np.random.default_rng(1)
+        X = pd.DataFrame(rng.normal(size=(50_000, 20)), columns=[f'f{i}' for i in range(20)])
+        y = (X['f0'] > 1).astype(int)
+
+        def fit_peak(fit):
+            tracemalloc.start()
+            try:
+                fit()
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        binned_peak = fit_peak(lambda: BinnedGradientBoostingModel(max_bins=32, max_iter=5).fit(X, y))
+        default_peak = fit_peak(
+            lambda: HistGradientBoostingClassifier(max_bins=32, max_iter=5, class_weight='balanced').fit(X, y))
+        self.assertLess(binned_peak, 0.75 * default_peak)
+
+    def test_predict_before_fit_raises(self):
+        """Test that scoring without stored edges fails clearly."""
+        with self.assertRaises(ValueError):
+            BinnedGradientBoostingModel().predict_proba(self.X)
+
+if __name__ == '__main__':
+    unittest.main()
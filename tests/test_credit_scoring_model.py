@@ -0,0 +1,92 @@
+import unittest
+import pandas as pd
+import numpy as np
+import os
+import sys
+import tempfile
+
+# Add the scripts directory to the path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "scripts"))
+)
+from credit_scoring_model import CreditScoreRFM, RFMScorer
+
+
+class TestRFMScorer(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a sample RFM DataFrame for testing."""
+        rng = np.random.default_rng(1)
+        n = 200
+        self.rfm_df = pd.DataFrame({
+            'CustomerId': [f'CustomerId_{i}' for i in range(n)],
+            'Recency': rng.integers(0, 90, n),
+            'Frequency': rng.integers(1, 500, n),
+            'Monetary': rng.normal(50000, 20000, n),
+        })
+
+    def test_matches_calculate_rfm_scores(self):
+        """Test that the fitted scorer reproduces the qcut-based scores and labels."""
+        expected = CreditScoreRFM(self.rfm_df).calculate_rfm_scores(self.rfm_df.copy())
+        result = RFMScorer().fit(self.rfm_df).transform(self.rfm_df)
+
+        np.testing.assert_allclose(result['RFM_Score'], expected['RFM_Score'])
+        np.testing.assert_array_equal(result['r_quartile'], expected['r_quartile'].astype(int))
+        np.testing.assert_array_equal(result['Risk_Label'], expected['Risk_Label'])
+
+    def test_scores_new_customers_with_stored_edges(self):
+        """Test that out-of-range customers are clipped into the outer quartiles."""
+        scorer = RFMScorer().fit(self.rfm_df)
+        new_customers = pd.DataFrame({'Recency': [0, 1000], 'Frequency': [10000, 0], 'Monetary': [1e9, -1e9]})
+        result = scorer.transform(new_customers)
+        self.assertEqual(result['RFM_Score'].tolist(), [4.0, 1.0])
+        self.assertEqual(result['Risk_Label'].tolist(), ['Good', 'Bad'])
+
+    def test_save_and_load_round_trip(self):
+        """Test that the JSON artifact restores an identical scorer."""
+        scorer = RFMScorer().fit(self.rfm_df)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'rfm_scorer.json')
+            scorer.save(path)
+            restored = RFMScorer.load(path)
+        self.assertEqual(restored.threshold, scorer.threshold)
+        np.testing.assert_allclose(restored.score(self.rfm_df), scorer.score(self.rfm_df))
+
+    def test_missing_values_raise(self):
+        """Test that missing RFM values are rejected when fitting and scoring."""
+        with_missing = self.rfm_df.copy()
+        with_missing.loc[0, 'Recency'] = np.nan
+        with self.assertRaises(ValueError):
+            RFMScorer().fit(with_missing)
+        scorer = RFMScorer().fit(self.rfm_df)
+        for col in ['Recency', 'Frequency', 'Monetary']:
+            with self.subTest(col=col):
+                new_customer = self.rfm_df.head(1).copy()
+                new_customer[col] = np.nan
+                with self.assertRaises(ValueError):
+                    scorer.transform(new_customer)
+
+    def test_tied_quantiles_are_dropped_like_qcut(self):
+        """Test that skewed columns get dense quartiles matching qcut(duplicates='drop')."""
+        skewed = self.rfm_df.copy()
+        skewed.loc[skewed.index[:120], 'Frequency'] = 1
+        skewed.loc[skewed.index[:110], 'Recency'] = 0
+        result = RFMScorer().fit(skewed).transform(skewed)
+
+        for col, quartile_col in [('Frequency', 'f_quartile'), ('Recency', 'r_quartile')]:
+            with self.subTest(col=col):
+                codes = pd.qcut(skewed[col], 4, labels=False, duplicates='drop') + 1
+                n_bins = codes.max()
+                if col == 'Recency':
+                    codes = n_bins + 1 - codes
+                self.assertLess(n_bins, 4)
+                np.testing.assert_array_equal(result[quartile_col], codes)
+                self.assertEqual(set(result[quartile_col]), set(range(1, n_bins + 1)))
+
+    def test_unfitted_scorer_raises(self):
+        """Test that scoring without fitted edges fails clearly."""
+        with self.assertRaises(ValueError):
+            RFMScorer().transform(self.rfm_df)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+import pandas as pd
+import numpy as np
+import os
+import sys
+import tempfile
+import threading
+
+# Add the API directory to the path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "api"))
+)
+from drift_monitor import DriftMonitor, OTHER_CATEGORY
+
+
+class TestDriftMonitor(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a sample training DataFrame for testing."""
+        rng = np.random.default_rng(2)
+        n = 1000
+        self.train_df = pd.DataFrame({
+            'Amount': rng.normal(1000, 200, n),
+            'Value': np.abs(rng.normal(1000, 200, n)),
+            'ProductCategory': rng.choice(['airtime', 'financial_services', 'utility_bill'], n),
+            'ChannelId': rng.choice(['ChannelId_1', 'ChannelId_3'], n),
+            'CountryCode': '256',
+        })
+        self.monitor = DriftMonitor.from_training_data(self.train_df, refresh_seconds=0)
+
+    def test_training_like_traffic_is_stable(self):
+        """Test that traffic drawn from the training data reports low PSI."""
+        for row in self.train_df.to_dict('records'):
+            self.monitor.record(row)
+        report = self.monitor.report()
+        for feature, result in report['features'].items():
+            self.assertEqual(result['observations'], len(self.train_df))
+            self.assertLess(result['psi'], 1e-6, feature)
+            self.assertEqual(result['status'], 'stable')
+
+    def test_shifted_traffic_is_flagged(self):
+        """Test that shifted numeric and unseen categorical inputs raise PSI."""
+        for _ in range(200):
+            self.monitor.record({'Amount': 5000.0, 'Value': None, 'ProductCategory': 'tv',
+                                 'ChannelId': 'ChannelId_1', 'CountryCode': '256'})
+        features = self.monitor.report()['features']
+        self.assertEqual(features['Amount']['status'], 'significant')
+        self.assertEqual(features['Value']['bins'][-1]['actual'], 1.0)
+        self.assertEqual(features['ProductCategory']['bins'][-1]['bin'], OTHER_CATEGORY)
+        self.assertEqual(features['ProductCategory']['status'], 'significant')
+
+    def test_record_batch_matches_record(self):
+        """Test that vectorized and per-request recording produce the same counts."""
+        served = self.train_df.sample(300, random_state=0)
+        served.loc[served.index[:5], 'Amount'] = np.nan
+        batch_monitor = DriftMonitor(self.monitor.profile)
+        batch_monitor.record_batch(served)
+        for row in served.to_dict('records'):
+            self.monitor.record(row)
+        np.testing.assert_array_equal(batch_monitor.counts(), self.monitor.counts())
+
+    def test_counts_are_merged_across_threads(self):
+        """Test that per-thread shards are summed into one report."""
+        row = self.train_df.iloc[0].to_dict()
+        threads = [threading.Thread(target=lambda: [self.monitor.record(row) for _ in range(100)])
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.monitor.report()['features']['Amount']['observations'], 400)
+
+    def test_exited_threads_release_their_shards(self):
+        """Test that shards of finished threads are folded into the totals instead of kept."""
+        row = self.train_df.iloc[0].to_dict()
+        for _ in range(200):
+            thread = threading.Thread(target=self.monitor.record, args=(row,))
+            thread.start()
+            thread.join()
+        self.monitor.record(row)
+        self.assertEqual(len(self.monitor._shards), 1)
+        self.assertEqual(self.monitor.report()['features']['Amount']['observations'], 201)
+
+    def test_save_and_load_profile(self):
+        """Test that the JSON profile restores the same bins."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'drift_profile.json')
+            self.monitor.save(path)
+            restored = DriftMonitor.load(path)
+        self.assertEqual(restored.profile, self.monitor.profile)
+
+    def test_no_traffic_reports_no_data(self):
+        """Test the report before any input has been served."""
+        self.assertEqual(self.monitor.report()['features']['Amount']['status'], 'no_data')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+import pandas as pd
+import numpy as np
+import os
+import sys
+
+# Add the scripts directory to the path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "scripts"))
+)
+from feature_engineering import FeatureEngineering, FeaturePlan
+
+
+class TestFeaturePlan(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a sample DataFrame with missing values and a non-default index."""
+        rng = np.random.default_rng(3)
+        n = 60
+        amount = rng.normal(500, 150, n)
+        amount[[3, 17]] = np.nan
+        times = pd.date_range('2023-01-01', periods=n, freq='7h').astype(str).tolist()
+        times[5] = 'not a date'
+        self.df = pd.DataFrame({
+            'TransactionId': np.arange(n),
+            'CustomerId': rng.choice(['c1', 'c2', 'c3', 'c4', 'c5'], n),
+            'Amount': amount,
+            'Value': rng.integers(1, 1000, n),
+            'TransactionStartTime': times,
+            'Category': rng.choice(['A', 'B', 'C'], n),
+        }, index=np.arange(100, 100 + n))
+
+    def eager(self, strategy='mean'):
+        df = FeatureEngineering.create_aggregate_features(self.df)
+        df = FeatureEngineering.extract_time_features(df)
+        df = FeatureEngineering.encode_categorical_features(df, ['Category'])
+        df = FeatureEngineering.handle_missing_values(df, strategy=strategy)
+        return FeatureEngineering.normalize_numerical_features(df, ['Amount', 'Total_Transaction_Amount'])
+
+    def plan(self, strategy='mean'):
+        return (FeatureEngineering.plan()
+                .create_aggregate_features()
+                .extract_time_features()
+                .encode_categorical_features(['Category'])
+                .handle_missing_values(strategy)
+                .normalize_numerical_features(['Amount', 'Total_Transaction_Amount']))
+
+    def test_full_output_matches_eager_chain(self):
+        """Test that the fused plan reproduces the eager chain column for column."""
+        for strategy in ['mean', 'median', 'most_frequent', 'remove']:
+            with self.subTest(strategy=strategy):
+                pd.testing.assert_frame_equal(self.plan(strategy).execute(self.df), self.eager(strategy))
+
+    def test_selected_output_matches_eager_chain(self):
+        """Test that pruning to a few output columns gives the same values."""
+        cols = ['Amount', 'Std_Transaction_Amount', 'Transaction_Hour', 'Category']
+        for strategy in ['mean', 'remove']:
+            with self.subTest(strategy=strategy):
+                result = self.plan(strategy).select(cols).execute(self.df)
+                pd.testing.assert_frame_equal(result, self.eager(strategy)[cols])
+
+    def test_aggregates_handle_missing_customers(self):
+        """Test broadcasting when some rows have no customer, as with the eager merge."""
+        df = self.df.copy()
+        df.loc[df.index[:4], 'CustomerId'] = None
+        result = FeaturePlan().create_aggregate_features().execute(df)
+        pd.testing.assert_frame_equal(result, FeatureEngineering.create_aggregate_features(df))
+
+    def test_pruned_steps_are_skipped(self):
+        """Test that only the columns the output needs are read."""
+        result = FeaturePlan().create_aggregate_features().select(['Category']).execute(self.df)
+        self.assertEqual(result.columns.tolist(), ['Category'])
+        self.assertEqual(result.index.tolist(), list(range(len(self.df))))
+
+    def test_input_is_not_modified(self):
+        """Test that executing a plan leaves the input untouched."""
+        original = self.df.copy()
+        self.plan().execute(self.df)
+        pd.testing.assert_frame_equal(self.df, original)
+
+    def test_invalid_plans_raise(self):
+        """Test the same validation errors as the eager API."""
+        with self.assertRaises(ValueError):
+            FeaturePlan().handle_missing_values('unknown')
+        with self.assertRaises(ValueError):
+            FeaturePlan().encode_categorical_features(['Missing']).execute(self.df)
+        with self.assertRaises(ValueError):
+            FeaturePlan().create_aggregate_features().execute(self.df.drop(columns=['Amount']))
+        with self.assertRaises(KeyError):
+            FeaturePlan().select(['Transaction_Hour']).execute(self.df)
+
+if __name__ == '__main__':
+    unittest.main()
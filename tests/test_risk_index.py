@@ -0,0 +1,162 @@
+import unittest
+import pandas as pd
+import numpy as np
+import os
+import sys
+import tempfile
+from sklearn.ensemble import GradientBoostingClassifier
+
+# Add the scripts directory to the path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "scripts"))
+)
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "api"))
+)
+from build_risk_index import build_customer_features, build_risk_index, parse_args, score_customers
+from feature_engineering import FeatureEngineering
+from risk_index import RiskIndex, write_risk_index
+
+
+class TestRiskIndex(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a temporary index directory."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, 'risk_index')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_lookup_uses_sorted_memory_mapped_arrays(self):
+        """Test that ids are stored sorted and looked up from memory-mapped arrays."""
+        write_risk_index(self.path, ['CustomerId_3', 'CustomerId_10', 'CustomerId_1'], [0.2, 0.9, 0.5], 'run-1')
+        index = RiskIndex(self.path)
+
+        self.assertIsInstance(index.ids, np.memmap)
+        self.assertEqual(index.ids.tolist(), [b'CustomerId_1', b'CustomerId_10', b'CustomerId_3'])
+        self.assertEqual(index.lookup('CustomerId_10'), {
+            'customer_id': 'CustomerId_10',
+            'risk_probability': np.float32(0.9).item(),
+            'risk_category': 'high',
+            'model_version': 'run-1',
+        })
+        self.assertEqual(index.lookup('CustomerId_1')['risk_category'], 'high')
+        self.assertEqual(index.lookup('CustomerId_3')['risk_category'], 'low')
+
+    def test_unknown_ids_are_not_found(self):
+        """Test ids that are absent, out of range, or longer than the stored width."""
+        write_risk_index(self.path, ['b', 'd'], [0.1, 0.2], 'run-1')
+        index = RiskIndex(self.path)
+        for customer_id in ['a', 'c', 'e', '', 'dddddd']:
+            self.assertIsNone(index.lookup(customer_id), customer_id)
+
+    def test_rebuild_is_picked_up_by_open_index(self):
+        """Test that an open index maps a rebuilt version without being reopened."""
+        write_risk_index(self.path, ['a'], [0.1], 'run-1')
+        index = RiskIndex(self.path, refresh_seconds=0)
+        self.assertEqual(index.lookup('a')['model_version'], 'run-1')
+
+        for version in ['run-2', 'run-3', 'run-4']:
+            write_risk_index(self.path, ['a', 'b'], [0.7, 0.2], version)
+        self.assertEqual(len(index), 1)
+        self.assertEqual(index.lookup('a')['model_version'], 'run-4')
+        self.assertEqual(len(index), 2)
+
+        # Only the current and the previous version are kept next to the symlink
+        self.assertTrue(os.path.islink(self.path))
+        self.assertEqual(len(os.listdir(self.tmp_dir.name)), 3)
+
+    def test_index_created_after_startup_becomes_available(self):
+        """Test that a missing index is picked up once it is built."""
+        index = RiskIndex(self.path, refresh_seconds=0)
+        self.assertFalse(index.available)
+        self.assertIsNone(index.lookup('a'))
+
+        write_risk_index(self.path, ['a'], [0.9], 'run-1')
+        self.assertEqual(index.lookup('a')['risk_category'], 'high')
+        self.assertTrue(index.available)
+
+    def test_unversioned_index_is_replaced(self):
+        """Test rebuilding over an index directory written before versioning."""
+        write_risk_index(self.path, ['a'], [0.1], 'run-1')
+        legacy = os.path.realpath(self.path)
+        os.remove(self.path)
+        os.rename(legacy, self.path)
+
+        write_risk_index(self.path, ['a'], [0.6], 'run-2')
+        self.assertTrue(os.path.islink(self.path))
+        self.assertEqual(RiskIndex(self.path).lookup('a')['model_version'], 'run-2')
+
+    def test_duplicate_ids_raise(self):
+        """Test that duplicate customer ids are rejected."""
+        with self.assertRaises(ValueError):
+            write_risk_index(self.path, ['a', 'a'], [0.1, 0.2], 'run-1')
+
+    def test_build_risk_index_scores_every_customer(self):
+        """Test the job end to end with the default features, including single-transaction customers."""
+        transactions = pd.DataFrame({
+            'TransactionId': [1, 2, 3, 4, 5, 6],
+            'CustomerId': ['c1', 'c1', 'c2', 'c3', 'c3', 'c4'],
+            'Amount': [100.0, 200.0, 5000.0, 10.0, 20.0, np.nan],
+            'TransactionStartTime': ['2023-01-01', '2023-01-05', '2023-01-02', '2023-01-03', '2023-01-04',
+                                     '2023-01-06'],
+        })
+        features = build_customer_features(transactions)
+        self.assertEqual(features['CustomerId'].tolist(), ['c1', 'c2', 'c3', 'c4'])
+        self.assertEqual(features.loc[0, 'Transaction_Count'], 2)
+        self.assertEqual(features.loc[1, 'Std_Transaction_Amount'], 0.0)
+        self.assertFalse(features.isna().any().any())
+
+        feature_cols = [col for col in features.columns if col != 'CustomerId']
+        model = GradientBoostingClassifier(n_estimators=5).fit(features[feature_cols], [0, 1, 0, 1])
+        scores = build_risk_index(transactions, model, self.path, 'run-1')
+
+        index = RiskIndex(self.path)
+        self.assertEqual(len(index), 4)
+        for customer_id, proba in zip(scores['CustomerId'], scores['risk_probability']):
+            self.assertAlmostEqual(index.lookup(customer_id)['risk_probability'], proba, places=6)
+
+    def test_aggregates_match_feature_engineering(self):
+        """Test that the per-customer aggregates equal the transaction-level ones of FeatureEngineering."""
+        rng = np.random.default_rng(0)
+        transactions = pd.DataFrame({
+            'TransactionId': np.arange(300),
+            'CustomerId': [f'c{i}' for i in rng.integers(0, 40, 300)],
+            'Amount': rng.normal(1000, 500, 300),
+            'TransactionStartTime': pd.date_range('2023-01-01', periods=300, freq='h').astype(str),
+        })
+        features = build_customer_features(transactions).set_index('CustomerId')
+        expected = FeatureEngineering.create_aggregate_features(transactions).groupby('CustomerId').first()
+        for col in ['Total_Transaction_Amount', 'Average_Transaction_Amount', 'Transaction_Count']:
+            np.testing.assert_allclose(features[col], expected.loc[features.index, col])
+        np.testing.assert_allclose(
+            features['Std_Transaction_Amount'], expected.loc[features.index, 'Std_Transaction_Amount'].fillna(0.0))
+
+    def test_model_feature_columns_are_used(self):
+        """Test that the model's recorded feature columns pick the features it is scored on."""
+        transactions = pd.DataFrame({
+            'TransactionId': [1, 2, 3, 4],
+            'CustomerId': ['c1', 'c1', 'c2', 'c3'],
+            'Amount': [100.0, 200.0, 5000.0, 10.0],
+            'TransactionStartTime': ['2023-01-01', '2023-01-05', '2023-01-02', '2023-01-03'],
+        })
+        features = build_customer_features(transactions)
+        model = GradientBoostingClassifier(n_estimators=5).fit(features[['Monetary', 'Frequency']], [0, 1, 0])
+        scores = score_customers(transactions, model)
+        np.testing.assert_allclose(
+            scores['risk_probability'], model.predict_proba(features[['Monetary', 'Frequency']])[:, 1])
+
+        unnamed = GradientBoostingClassifier(n_estimators=5).fit(features[['Monetary']].to_numpy(), [0, 1, 0])
+        with self.assertRaises(ValueError):
+            score_customers(transactions, unnamed)
+
+    def test_cli_requires_model_uri(self):
+        """Test that the job has no default model to fall back on."""
+        with self.assertRaises(SystemExit):
+            parse_args(['data.csv'])
+        args = parse_args(['data.csv', '--model-uri', 'models:/customer_risk/1'])
+        self.assertEqual(args.model_uri, 'models:/customer_risk/1')
+
+if __name__ == '__main__':
+    unittest.main()
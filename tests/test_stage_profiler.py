@@ -0,0 +1,117 @@
+import unittest
+import pandas as pd
+import numpy as np
+import os
+import sys
+import json
+import tempfile
+import tracemalloc
+
+# Add the scripts directory to the path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "scripts"))
+)
+from stage_profiler import profiler, profile_stage
+from feature_engineering import FeatureEngineering
+from credit_scoring_model import CreditScoreRFM
+
+
+class TestStageProfiler(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a sample DataFrame and a clean, enabled profiler."""
+        self.df = pd.DataFrame({
+            'TransactionId': [1, 2, 3, 4],
+            'CustomerId': [101, 101, 102, 103],
+            'Amount': [100.0, 200.0, 150.0, np.nan],
+            'TransactionStartTime': ['2023-01-01 10:00:00',
+                                     '2023-01-02 12:00:00',
+                                     '2023-01-03 15:00:00',
+                                     '2023-01-04 18:00:00'],
+        })
+        profiler.reset()
+        profiler.enable()
+
+    def tearDown(self):
+        profiler.disable()
+        profiler.reset()
+
+    def test_decorated_steps_are_recorded(self):
+        """Test that feature engineering steps record rows, memory and timings."""
+        df = FeatureEngineering.create_aggregate_features(self.df)
+        FeatureEngineering.handle_missing_values(df, strategy='remove')
+        records = profiler.report()
+
+        self.assertEqual([r['stage'] for r in records], [
+            'FeatureEngineering.create_aggregate_features',
+            'FeatureEngineering.handle_missing_values',
+        ])
+        self.assertEqual(records[0]['rows_in'], 4)
+        self.assertGreater(records[0]['memory_out_bytes'], records[0]['memory_in_bytes'])
+        self.assertEqual(records[1]['rows_out'], 2)
+        for record in records:
+            self.assertGreaterEqual(record['wall_time_s'], 0)
+            self.assertGreaterEqual(record['tracemalloc_peak_bytes'], 0)
+            self.assertFalse(record['failed'])
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_method_input_is_read_from_instance(self):
+        """Test that methods without a DataFrame argument use the instance's frame."""
+        CreditScoreRFM(self.df.copy()).calculate_rfm()
+        record = profiler.report()[0]
+        self.assertEqual(record['stage'], 'CreditScoreRFM.calculate_rfm')
+        self.assertEqual(record['rows_in'], 4)
+        self.assertEqual(record['rows_out'], 3)
+
+    def test_nested_stages_propagate_peak(self):
+        """Test that an outer stage's peak covers allocations made inside inner stages."""
+        @profile_stage(name='allocate')
+        def allocate():
+            return pd.DataFrame({'x': np.ones(1_000_000)})
+
+        with profiler.stage('outer') as stage:
+            stage.output(allocate())
+        inner, outer = profiler.report()
+        self.assertEqual(outer['stage'], 'outer')
+        self.assertEqual(inner['depth'], 1)
+        self.assertGreaterEqual(inner['tracemalloc_peak_bytes'], 8_000_000)
+        self.assertGreaterEqual(outer['tracemalloc_peak_bytes'], inner['tracemalloc_peak_bytes'])
+
+    def test_external_tracemalloc_peak_is_kept(self):
+        """Test that stages do not reset the peak of a caller that started tracemalloc."""
+        tracemalloc.start()
+        try:
+            buffer = np.ones(1_000_000)
+            del buffer
+            caller_peak = tracemalloc.get_traced_memory()[1]
+            FeatureEngineering.extract_time_features(self.df)
+            self.assertGreaterEqual(tracemalloc.get_traced_memory()[1], caller_peak)
+            self.assertTrue(tracemalloc.is_tracing())
+        finally:
+            tracemalloc.stop()
+
+    def test_failed_stage_is_recorded(self):
+        """Test that a stage raising an error is still reported."""
+        with self.assertRaises(ValueError):
+            FeatureEngineering.handle_missing_values(self.df, strategy='unknown')
+        self.assertTrue(profiler.report()[0]['failed'])
+
+    def test_write_report(self):
+        """Test that the report is written as JSON."""
+        FeatureEngineering.extract_time_features(self.df)
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'profile.json')
+            profiler.write_report(path)
+            with open(path) as f:
+                self.assertEqual(json.load(f)[0]['stage'], 'FeatureEngineering.extract_time_features')
+
+    def test_disabled_profiler_records_nothing(self):
+        """Test that nothing is recorded while profiling is disabled."""
+        profiler.disable()
+        FeatureEngineering.extract_time_features(self.df)
+        with profiler.stage('noop') as stage:
+            stage.output(self.df)
+        self.assertEqual(profiler.report(), [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+import unittest
+import asyncio
+import io
+import json
+import pandas as pd
+import numpy as np
+import os
+import sys
+import pyarrow as pa
+
+# Add the API directory to the path
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src", "api"))
+)
+from streaming import StreamScorer, open_arrow_stream, stream_ndjson, validate_frame
+
+
+class AmountModel:
+    """Scores the share of Amount in Amount + Value, so results are easy to check."""
+
+    def predict_proba(self, df):
+        p = (df['Amount'] / (df['Amount'] + df['Value'])).to_numpy()
+        return np.column_stack([1 - p, p])
+
+
+async def chunked(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+async def open_arrow(chunks, score):
+    async for output in await open_arrow_stream(chunks, score):
+        yield output
+
+
+def collect(outputs) -> bytes:
+    async def run():
+        return b''.join([chunk async for chunk in outputs])
+    return asyncio.run(run())
+
+
+class TestStreaming(unittest.TestCase):
+
+    def setUp(self):
+        """Set up sample prediction inputs, including invalid rows."""
+        self.rows = pd.DataFrame({
+            'AccountId': ['a1', 'a2', 'a3', None],
+            'Amount': [300.0, 100.0, np.nan, 50.0],
+            'Value': [100.0, 300.0, 10.0, 50.0],
+            'ProductCategory': ['airtime', 'utility_bill', 'airtime', 'airtime'],
+            'ChannelId': ['ChannelId_3'] * 4,
+            'CountryCode': ['256'] * 4,
+            'TransactionStartTime': ['2023-01-01T10:00:00Z'] * 4,
+        })
+        self.scorer = StreamScorer(AmountModel(), 'run-1')
+
+    def test_validate_frame_flags_invalid_rows(self):
+        """Test column-wise validation and coercion."""
+        frame = self.rows.assign(Value=['100', 'x', '10', '50'])
+        clean, valid, errors = validate_frame(frame)
+        self.assertEqual(valid.tolist(), [True, False, False, False])
+        self.assertEqual(errors[1], "Invalid or missing value for 'Value'")
+        self.assertEqual(errors[2], "Invalid or missing value for 'Amount'")
+        self.assertEqual(errors[3], "Invalid or missing value for 'AccountId'")
+        self.assertEqual(clean['Value'].dtype, np.float64)
+
+        _, valid, errors = validate_frame(self.rows.drop(columns=['CountryCode']))
+        self.assertFalse(valid.any())
+
+    def test_ndjson_stream(self):
+        """Test NDJSON scoring across small body chunks and batches."""
+        body = self.rows.to_json(orient='records', lines=True).encode()
+        output = collect(stream_ndjson(chunked(body, 7), self.scorer.score, batch_bytes=64))
+        results = [json.loads(line) for line in output.decode().splitlines()]
+
+        self.assertEqual(len(results), 4)
+        self.assertEqual(results[0], {'customer_id': 'a1', 'risk_probability': 0.75, 'risk_category': 'high',
+                                      'model_version': 'run-1', 'error': None})
+        self.assertEqual(results[1]['risk_category'], 'low')
+        self.assertIsNone(results[2]['risk_probability'])
+        self.assertEqual(results[2]['error'], "Invalid or missing value for 'Amount'")
+        self.assertIsNone(results[3]['customer_id'])
+
+    def test_ndjson_row_of_another_type_keeps_alignment(self):
+        """Test that one row with a wrong type only invalidates that row."""
+        rows = pd.concat([self.rows.iloc[:2]] * 50, ignore_index=True)
+        lines = rows.to_json(orient='records', lines=True).splitlines()
+        lines[60] = lines[60].replace('"Amount":300.0', '"Amount":"abc"')
+        lines[70] = lines[70].replace('"AccountId":"a1"', '"AccountId":12')
+        body = ('\n'.join(lines) + '\n').encode()
+
+        output = collect(stream_ndjson(chunked(body, 4096), self.scorer.score))
+        results = [json.loads(line) for line in output.decode().splitlines()]
+        self.assertEqual(len(results), len(lines))
+        self.assertEqual(results[60]['error'], "Invalid or missing value for 'Amount'")
+        self.assertEqual(results[70]['customer_id'], '12')
+        self.assertIsNone(results[70]['error'])
+        self.assertEqual(sum(r['error'] is not None for r in results), 1)
+
+    def test_malformed_ndjson_lines_report_errors(self):
+        """Test that unparsable lines get one error record each, in input order."""
+        lines = self.rows.iloc[:2].to_json(orient='records', lines=True).splitlines()
+        body = '\n'.join([lines[0], '{"AccountId": ', '', lines[1], '[1, 2]']).encode()
+
+        output = collect(stream_ndjson(chunked(body, 4), self.scorer.score))
+        results = [json.loads(line) for line in output.decode().splitlines()]
+        self.assertEqual([r['error'] for r in results], [None, 'Malformed NDJSON line', None, 'Malformed NDJSON line'])
+        self.assertEqual([r['customer_id'] for r in results], ['a1', None, 'a2', None])
+        self.assertEqual(results[2]['risk_probability'], 0.25)
+
+    def test_ndjson_lines_that_are_not_objects_report_errors(self):
+        """Test that valid JSON lines other than objects get error records instead of failing the batch."""
+        lines = self.rows.iloc[:2].to_json(orient='records', lines=True).splitlines()
+        body = '\n'.join([lines[0], '[1]', lines[1], '1', 'true']).encode()
+
+        output = collect(stream_ndjson(chunked(body, 4), self.scorer.score))
+        results = [json.loads(line) for line in output.decode().splitlines()]
+        self.assertEqual([r['error'] for r in results], [None, 'Malformed NDJSON line', None] + ['Malformed NDJSON line'] * 2)
+        self.assertEqual([r['customer_id'] for r in results], ['a1', None, 'a2', None, None])
+
+    def test_arrow_stream(self):
+        """Test Arrow IPC scoring with results streamed batch by batch."""
+        table = pa.Table.from_pandas(self.rows, preserve_index=False)
+        sink = io.BytesIO()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            for batch in table.to_batches(max_chunksize=2):
+                writer.write_batch(batch)
+
+        output = collect(open_arrow(chunked(sink.getvalue(), 50), self.scorer.score))
+        batches = list(pa.ipc.open_stream(output))
+        self.assertEqual([b.num_rows for b in batches], [2, 2])
+        results = pa.Table.from_batches(batches).to_pydict()
+        self.assertEqual(results['risk_probability'][:2], [0.75, 0.25])
+        self.assertEqual(results['risk_category'], ['high', 'low', None, None])
+        self.assertEqual(results['model_version'][0], 'run-1')
+
+    def test_empty_arrow_stream(self):
+        """Test that a stream without batches returns an empty result stream."""
+        sink = io.BytesIO()
+        with pa.ipc.new_stream(sink, pa.schema([('AccountId', pa.string())])):
+            pass
+        output = collect(open_arrow(chunked(sink.getvalue(), 50), self.scorer.score))
+        self.assertEqual(pa.ipc.open_stream(output).read_all().num_rows, 0)
+
+    def test_invalid_arrow_stream_fails_before_streaming(self):
+        """Test that a body that is not Arrow IPC raises while opening the stream."""
+        async def run():
+            await open_arrow_stream(chunked(b'{"AccountId": "a1"}\n' * 10, 8), self.scorer.score)
+        with self.assertRaises(ValueError):
+            asyncio.run(run())
+
+if __name__ == '__main__':
+    unittest.main()